@@ -1,9 +1,18 @@
 import csv
-import json
 import time
+import operator
+import orjson
 import requests
 import os
-from typing import List, Dict, Any, Optional
+import sqlite3
+import threading
+import multiprocessing
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Optional, Hashable, Iterable, Iterator
 from dataclasses import dataclass
 
 # ==================================================
@@ -28,6 +37,121 @@ OUTPUT_FIELDNAMES = [
     "apollo_error"
 ]
 
+# Blank output row, copied for every failed lookup
+_EMPTY_TEMPLATE = dict.fromkeys(OUTPUT_FIELDNAMES)
+
+# Result dict → CSV row tuple in one C-level call (every result carries all fields)
+_ROW_GET = operator.itemgetter(*OUTPUT_FIELDNAMES)
+
+# people/bulk_match accepts up to 10 people per request
+BULK_MATCH_SIZE = 10
+
+# Bulk failures that mean the endpoint/request is unusable → retry the batch per URL.
+# Anything else (429, 5xx, auth) is returned as-is so the client backs off.
+_BULK_FALLBACK_STATUSES = frozenset({404, 422})
+
+# Contact selection rules used by the extraction helpers
+_VERIFIED_STATUS = "verified"
+_EMAIL_TYPES = frozenset({"work", "email"})
+_MOBILE_LABEL = "mobile"
+
+# Only these person/organization keys are read downstream; everything else is dropped on arrival
+_PERSON_KEYS = ("linkedin_url", "first_name", "last_name", "title", "id", "organization", "emails", "phone_numbers")
+_ORG_KEYS = ("name", "website_url", "industry")
+
+# Response caches → repeated LinkedIn URLs skip the HTTP call and the credit
+CACHE_MAXSIZE = 5000
+MATCH_CACHE_TTL = 4 * 3600
+ENRICH_CACHE_TTL = 24 * 3600
+
+# Results carrying these errors are retried on the next run instead of checkpointed
+_TRANSIENT_ERROR_PREFIXES = ("MATCH API error", "Enrich error")
+
+# Output is written as results arrive; flush to disk every N rows
+FLUSH_EVERY = 50
+
+# Parquet output is written as one row group per N results
+PARQUET_BATCH_ROWS = 10_000
+
+# Large file buffers → far fewer read()/write() syscalls on big CSVs
+IO_BUFFER_SIZE = 1024 * 1024
+
+
+# ==================================================
+# LinkedIn URL Normalization
+# ==================================================
+def normalize_linkedin_url(url: Optional[str]) -> str:
+    """Canonical form used for dedup and cache keys ("" for blank input)."""
+    return (url or "").strip().lower()
+
+
+# ==================================================
+# Result Slimming
+# ==================================================
+def _slim_person(person: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Keep only the fields extraction and enrichment use (employment history etc. is dropped)."""
+    if not person:
+        return person
+
+    slim = {k: person.get(k) for k in _PERSON_KEYS}
+    org = person.get("organization") or {}
+    slim["organization"] = {k: org.get(k) for k in _ORG_KEYS}
+    return slim
+
+
+# ==================================================
+# Pure Extraction (module-level → picklable for worker processes)
+# ==================================================
+def _find_verified_email(person: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return next(
+        (e for e in person.get("emails") or ()
+         if e.get("status") == _VERIFIED_STATUS and e.get("type") in _EMAIL_TYPES),
+        None
+    )
+
+
+def _find_verified_mobile(person: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return next(
+        (p for p in person.get("phone_numbers") or ()
+         if p.get("label") == _MOBILE_LABEL and p.get("status") == _VERIFIED_STATUS),
+        None
+    )
+
+
+def _verified_email(person: Dict[str, Any]) -> Optional[str]:
+    email = _find_verified_email(person)
+    return email.get("email") if email else None
+
+
+def _verified_mobile(person: Dict[str, Any]) -> Optional[str]:
+    mobile = _find_verified_mobile(person)
+    return (mobile.get("sanitized_number") or mobile.get("number")) if mobile else None
+
+
+def _has_verified_mobile(person: Dict[str, Any]) -> bool:
+    return bool(_verified_mobile(person))
+
+
+def _extract_all_pure(person: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an output row from an Apollo person. No client state, no credit tracking."""
+    org = person.get("organization", {})
+
+    return {
+        "input_linkedin_url": person.get("linkedin_url"),
+        "first_name": person.get("first_name"),
+        "last_name": person.get("last_name"),
+        "job_title": person.get("title"),
+        "company_name": org.get("name"),
+        "company_website": org.get("website_url"),
+        "industry": org.get("industry"),
+        "verified_email": _verified_email(person),
+        "verified_mobile_phone": _verified_mobile(person),
+        "linkedin_url": person.get("linkedin_url"),
+        "apollo_person_id": person.get("id"),
+        "lookup_used": None,
+        "apollo_error": None
+    }
+
 
 # ==================================================
 # Credit Tracking Dataclass
@@ -40,6 +164,130 @@ class CreditUsage:
     mobile_credits: int = 0
 
 
+# ==================================================
+# In-Memory TTL/LRU Cache
+# ==================================================
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after `ttl` seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+# ==================================================
+# Token-Bucket Rate Limiter
+# ==================================================
+class TokenBucket:
+    """
+    Thread-safe token bucket: bursts up to `capacity` requests,
+    then refills at `refill_rate` tokens per second.
+    """
+
+    def __init__(self, capacity: int, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping only if the bucket is empty."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+            self._updated_at = now
+
+            # Going negative reserves a future token → waiters are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self.refill_rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+# ==================================================
+# Resumable Checkpoint (SQLite)
+# ==================================================
+class Checkpoint:
+    """
+    Finished lookups keyed by normalized LinkedIn URL, so a restarted run
+    skips rows it already paid for. Rows older than `max_age` seconds are
+    ignored, and the table is emptied once a run completes.
+    """
+
+    # Stay under SQLite's host-parameter limit on older builds
+    _QUERY_CHUNK = 500
+
+    def __init__(self, path: str, max_age: float = MATCH_CACHE_TTL):
+        self.path = path
+        self.max_age = max_age
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY, result_json BLOB, ts INTEGER)"
+        )
+        self._db.commit()
+
+    def load(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        found = {}
+        oldest = int(time.time() - self.max_age)
+        for i in range(0, len(urls), self._QUERY_CHUNK):
+            part = urls[i:i + self._QUERY_CHUNK]
+            rows = self._db.execute(
+                f"SELECT url, result_json FROM seen WHERE url IN ({','.join('?' * len(part))}) AND ts >= ?",
+                (*part, oldest)
+            )
+            found.update((url, orjson.loads(blob)) for url, blob in rows)
+        return found
+
+    def save(self, results: Dict[str, Dict[str, Any]]):
+        """Store final results in one transaction; transient API failures are skipped."""
+        now = int(time.time())
+        rows = [
+            (url, orjson.dumps(result), now)
+            for url, result in results.items()
+            if not (result["apollo_error"] or "").startswith(_TRANSIENT_ERROR_PREFIXES)
+        ]
+        with self._db:
+            self._db.executemany("INSERT OR REPLACE INTO seen (url, result_json, ts) VALUES (?, ?, ?)", rows)
+
+    def clear(self):
+        """Drop every stored row → nothing outlives a completed run."""
+        with self._db:
+            self._db.execute("DELETE FROM seen")
+
+    def close(self):
+        self._db.close()
+
+
 # ==================================================
 # APOLLO CLIENT
 # ==================================================
@@ -49,17 +297,63 @@ class ApolloClient:
     Apollo.io API Client — Compliant, POST-based, with enrichment fallback.
     """
 
-    def __init__(self, api_key: str, rate_limit_delay: float = 0.4):
+    def __init__(
+        self,
+        api_key: str,
+        rate_limit_delay: float = 0.4,
+        max_workers: int = 10,
+        burst: int = 10,
+        cpu_workers: Optional[int] = None,
+        checkpoint_path: Optional[str] = None
+    ):
         if not api_key:
             raise ValueError("Apollo API key required.")
 
         self.api_key = api_key
         self.base_url = APOLLO_API_BASE_URL
-        self.headers = {"X-Api-Key": api_key}
+        self.headers = {"X-Api-Key": api_key, "Connection": "keep-alive"}
         self.rate_limit_delay = rate_limit_delay
+        self.max_workers = max_workers
+
+        # Shared across worker threads → sustained rate stays at 1 / rate_limit_delay
+        self.bucket = TokenBucket(burst, 1 / rate_limit_delay) if rate_limit_delay > 0 else None
+
+        # One pooled session for every call → TCP/TLS handshakes are reused.
+        # At least one kept-alive connection per worker thread, so none is opened and discarded.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=max(20, max_workers),
+            # 429/5xx → exponential backoff with jitter, honoring Retry-After;
+            # the final response is returned so _post reports its real status code
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                backoff_jitter=0.25,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=["POST"],
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        ))
+
+        # Optional process pool for record extraction (off by default: rows are cheap to parse)
+        self._cpu_pool = (
+            ProcessPoolExecutor(max_workers=cpu_workers, mp_context=multiprocessing.get_context("spawn"))
+            if cpu_workers else None
+        )
 
         # Logical credit usage tracker (NOT actual Apollo credits)
         self.credits = CreditUsage()
+        self._credits_lock = threading.Lock()
+
+        # Successful responses only; cache hits are not billed
+        self._match_cache = TTLCache(CACHE_MAXSIZE, MATCH_CACHE_TTL)
+        self._enrich_cache = TTLCache(CACHE_MAXSIZE, ENRICH_CACHE_TTL)
+
+        # Optional on-disk record of finished rows → restarts don't re-spend credits
+        self.checkpoint = Checkpoint(checkpoint_path) if checkpoint_path else None
 
     # ============================================
     # Internal POST Request Handler
@@ -68,23 +362,84 @@ class ApolloClient:
         """Send POST request to Apollo.io API."""
         url = f"{self.base_url}/{endpoint}"
 
-        time.sleep(self.rate_limit_delay)
+        if self.bucket:
+            self.bucket.acquire()
 
         try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=30)
+            response = self.session.post(url, json=payload, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
 
         except requests.exceptions.RequestException as e:
             return {"error": str(e), "status_code": getattr(e.response, "status_code", 500)}
 
+        except orjson.JSONDecodeError as e:
+            return {"error": f"Invalid JSON response: {e}", "status_code": response.status_code}
+
+    def close(self):
+        """Release pooled HTTP connections, worker processes and the checkpoint DB."""
+        self.session.close()
+        if self._cpu_pool:
+            self._cpu_pool.shutdown()
+        if self.checkpoint:
+            self.checkpoint.close()
+
     # ==================================================
     # STEP 1 — MATCH BY LINKEDIN
     # ==================================================
     def match_by_linkedin(self, linkedin_url: str) -> Dict[str, Any]:
+        key = normalize_linkedin_url(linkedin_url)
+        cached = self._match_cache.get(key)
+        if cached is not None:
+            return cached
+
         payload = {"person": {"linkedin_url": linkedin_url.strip()}}
-        self.credits.match_credits += 1
-        return self._post("people/match", payload)
+        with self._credits_lock:
+            self.credits.match_credits += 1
+
+        response = self._post("people/match", payload)
+        if "error" not in response:
+            response = {"person": _slim_person(response.get("person"))}
+            self._match_cache.set(key, response)
+        return response
+
+    def match_by_linkedin_bulk(self, linkedin_urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Match up to BULK_MATCH_SIZE URLs in one request.
+        Returns one match-shaped response per input URL, in order.
+        """
+        keys = [normalize_linkedin_url(url) for url in linkedin_urls]
+        found = {}
+        misses = {}
+        for key, url in zip(keys, linkedin_urls):
+            cached = self._match_cache.get(key)
+            if cached is not None:
+                found[key] = cached
+            else:
+                misses.setdefault(key, url.strip())
+
+        if misses:
+            payload = {"details": [{"linkedin_url": url} for url in misses.values()]}
+            response = self._post("people/bulk_match", payload)
+            matches = response.get("matches")
+
+            if "error" in response and response.get("status_code") not in _BULK_FALLBACK_STATUSES:
+                # Rate limited / server / auth failure → every row reports the error
+                for key in misses:
+                    found[key] = response
+            elif "error" in response or not isinstance(matches, list) or len(matches) != len(misses):
+                # Endpoint or response shape unusable → single-URL path for this batch
+                for key, url in misses.items():
+                    found[key] = self.match_by_linkedin(url)
+            else:
+                with self._credits_lock:
+                    self.credits.match_credits += len(misses)
+                for key, person in zip(misses, matches):
+                    match = {"person": _slim_person(person)}
+                    self._match_cache.set(key, match)
+                    found[key] = match
+
+        return [found[key] for key in keys]
 
     # ==================================================
     # STEP 2 — ENRICH (Fallback)
@@ -100,27 +455,28 @@ class ApolloClient:
             "organization_name": person.get("organization", {}).get("name")
         }
 
-        self.credits.enrich_credits += 1
-        return self._post("people/enrich", payload)
+        key = tuple(payload.values())
+        cached = self._enrich_cache.get(key)
+        if cached is not None:
+            return cached
+
+        with self._credits_lock:
+            self.credits.enrich_credits += 1
+
+        response = self._post("people/enrich", payload)
+        if "error" not in response:
+            response = {"person": _slim_person(response.get("person"))}
+            self._enrich_cache.set(key, response)
+        return response
 
     # ==================================================
-    # Extraction Helpers
+    # Extraction Helpers (no credit tracking — _extract_all counts credits)
     # ==================================================
     def extract_verified_email(self, person: Dict[str, Any]) -> Optional[str]:
-        emails = person.get("emails", [])
-        for e in emails:
-            if e.get("status") == "verified" and e.get("type") in ("work", "email"):
-                self.credits.email_credits += 1
-                return e.get("email")
-        return None
+        return _verified_email(person)
 
     def extract_verified_mobile(self, person: Dict[str, Any]) -> Optional[str]:
-        phones = person.get("phone_numbers", [])
-        for p in phones:
-            if p.get("label") == "mobile" and p.get("status") == "verified":
-                self.credits.mobile_credits += 1
-                return p.get("sanitized_number") or p.get("number")
-        return None
+        return _verified_mobile(person)
 
     # ==================================================
     # MAIN PERSON LOOKUP WORKFLOW (Option B)
@@ -132,7 +488,22 @@ class ApolloClient:
 
         # STEP 1 — Match
         match = self.match_by_linkedin(linkedin_url)
+        return self._resolve_match(linkedin_url, match)
 
+    def lookup_people(self, linkedin_urls: List[Optional[str]]) -> List[Dict[str, Any]]:
+        """
+        Same workflow as lookup_person, but STEP 1 is one bulk match for the whole batch.
+        """
+        urls = [url for url in linkedin_urls if url]
+        matches = dict(zip(urls, self.match_by_linkedin_bulk(urls))) if urls else {}
+
+        return [
+            self._resolve_match(url, matches[url]) if url else self._empty_result(None, "Empty LinkedIn URL.")
+            for url in linkedin_urls
+        ]
+
+    def _resolve_match(self, linkedin_url: str, match: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a match response into a result row, enriching when no verified mobile."""
         if "error" in match:
             return self._empty_result(linkedin_url, f"MATCH API error: {match['error']}")
 
@@ -143,62 +514,55 @@ class ApolloClient:
         if not person:
             return self._empty_result(linkedin_url, "No match found.")
 
-        # Extract from MATCH response
-        extracted = self._extract_all(person)
-        extracted["lookup_used"] = lookup_used
-
-        # PRIORITY: verified mobile phone
-        if extracted["verified_mobile_phone"]:
+        # PRIORITY: verified mobile phone → MATCH response is enough
+        if _has_verified_mobile(person):
+            extracted = self._extract_all(person)
+            extracted["lookup_used"] = lookup_used
             return extracted
 
         # STEP 2 — ENRICH
         enrich = self.enrich_person(person)
         lookup_used = "enrich"
 
-        if "error" in enrich:
-            extracted["lookup_used"] = lookup_used
-            extracted["apollo_error"] = f"Enrich error: {enrich['error']}"
-            return extracted  # fallback to match result
-
-        enriched_person = enrich.get("person")
+        enriched_person = None if "error" in enrich else enrich.get("person")
         if enriched_person:
             enriched = self._extract_all(enriched_person)
             enriched["lookup_used"] = lookup_used
             enriched["input_linkedin_url"] = linkedin_url
             return enriched
 
-        # If enrichment returns nothing
+        # Enrichment failed or returned nothing → fall back to MATCH result
+        extracted = self._extract_all(person)
         extracted["lookup_used"] = lookup_used
-        extracted["apollo_error"] = "No enrichment data returned."
+        if "error" in enrich:
+            extracted["apollo_error"] = f"Enrich error: {enrich['error']}"
+        else:
+            extracted["apollo_error"] = "No enrichment data returned."
         return extracted
 
     # ==================================================
     # Extract all required fields
     # ==================================================
     def _extract_all(self, person: Dict[str, Any]) -> Dict[str, Any]:
-        org = person.get("organization", {})
+        if self._cpu_pool:
+            # Parsing runs in a worker process → I/O threads keep the GIL
+            extracted = self._cpu_pool.submit(_extract_all_pure, person).result()
+        else:
+            extracted = _extract_all_pure(person)
 
-        return {
-            "input_linkedin_url": person.get("linkedin_url"),
-            "first_name": person.get("first_name"),
-            "last_name": person.get("last_name"),
-            "job_title": person.get("title"),
-            "company_name": org.get("name"),
-            "company_website": org.get("website_url"),
-            "industry": org.get("industry"),
-            "verified_email": self.extract_verified_email(person),
-            "verified_mobile_phone": self.extract_verified_mobile(person),
-            "linkedin_url": person.get("linkedin_url"),
-            "apollo_person_id": person.get("id"),
-            "lookup_used": None,
-            "apollo_error": None
-        }
+        with self._credits_lock:
+            if extracted["verified_email"] is not None:
+                self.credits.email_credits += 1
+            if extracted["verified_mobile_phone"] is not None:
+                self.credits.mobile_credits += 1
+
+        return extracted
 
     # ==================================================
     # Empty/Failed Result
     # ==================================================
     def _empty_result(self, linkedin_url: Optional[str], error: str) -> Dict[str, Any]:
-        out = {field: None for field in OUTPUT_FIELDNAMES}
+        out = _EMPTY_TEMPLATE.copy()
         out["input_linkedin_url"] = linkedin_url
         out["apollo_error"] = error
         return out
@@ -211,45 +575,127 @@ class ApolloClient:
             print(f"Input CSV not found: {input_csv}")
             return
 
-        results = []
-        with open(input_csv, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        with open(input_csv, encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
 
-            if linkedin_column not in reader.fieldnames:
+            # Column name → index: O(1) validation and direct positional access.
+            # Duplicate names resolve to the last column, as csv.DictReader did.
+            columns = {name: i for i, name in enumerate(next(reader, []))}
+
+            col_idx = columns.get(linkedin_column)
+            if col_idx is None:
                 print(f"CSV missing column: {linkedin_column}")
                 return
 
-            for i, row in enumerate(reader):
-                url = row.get(linkedin_column)
-                result = self.lookup_person(url)
-                results.append(result)
-
-                if (i + 1) % 10 == 0:
-                    print(f"Processed {i+1} rows...")
-
-        self._write_output(results, output_path, output_format)
+            # Positional access → no per-row dict; blank lines skipped like DictReader
+            urls = (row[col_idx] if col_idx < len(row) else None for row in reader if row)
+            self._write_output(self._iter_results(urls), output_path, output_format)
 
         print("\n=== CREDIT USAGE SUMMARY ===")
         print(self.credits)
 
+    def _iter_results(self, urls: Iterable[Optional[str]]) -> Iterator[Dict[str, Any]]:
+        """
+        Look up URLs concurrently and yield results in input order.
+
+        Rows are read in chunks; within a chunk URLs are normalized, blanks dropped
+        and duplicates collapsed, so each unique URL is looked up once and its
+        result shared. Repeats across chunks are served by the response caches,
+        and URLs finished in an earlier run come from the checkpoint.
+        """
+        urls = iter(urls)
+        chunk_size = self.max_workers * 4 * BULK_MATCH_SIZE
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for chunk in iter(lambda: list(islice(urls, chunk_size)), []):
+                keys = [normalize_linkedin_url(url) for url in chunk]
+                unique = list(dict.fromkeys(key for key in keys if key))
+
+                resolved = self.checkpoint.load(unique) if self.checkpoint else {}
+                todo = [key for key in unique if key not in resolved]
+                batches = [todo[i:i + BULK_MATCH_SIZE] for i in range(0, len(todo), BULK_MATCH_SIZE)]
+
+                fresh = {}
+                for batch, results in zip(batches, pool.map(self.lookup_people, batches)):
+                    fresh.update(zip(batch, results))
+
+                if self.checkpoint and fresh:
+                    self.checkpoint.save(fresh)
+                resolved.update(fresh)
+
+                for url, key in zip(chunk, keys):
+                    if key:
+                        yield dict(resolved[key], input_linkedin_url=url)
+                    else:
+                        yield self._empty_result(None, "Empty LinkedIn URL.")
+
+                    done += 1
+                    if done % 10 == 0:
+                        print(f"Processed {done} rows...")
+
+        # Every row produced → the checkpoint is only for interrupted runs
+        if self.checkpoint:
+            self.checkpoint.clear()
+
     # ==================================================
-    # Write CSV or JSON
+    # Write CSV, JSON or Parquet (streamed)
     # ==================================================
-    def _write_output(self, results, output_path, fmt):
+    def _write_output(self, results: Iterable[Dict[str, Any]], output_path, fmt):
         if fmt == "csv":
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=OUTPUT_FIELDNAMES)
-                writer.writeheader()
-                writer.writerows(results)
+            with open(output_path, "w", newline="", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(OUTPUT_FIELDNAMES)
+                for i, result in enumerate(results, 1):
+                    writer.writerow(_ROW_GET(result))
+                    if i % FLUSH_EVERY == 0:
+                        f.flush()
             print(f"CSV saved: {output_path}")
 
         elif fmt == "json":
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(results, f, indent=4)
+            # One JSON array, written item by item
+            with open(output_path, "wb", buffering=IO_BUFFER_SIZE) as f:
+                f.write(b"[")
+                for i, result in enumerate(results, 1):
+                    f.write(b",\n" if i > 1 else b"\n")
+                    f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+                    if i % FLUSH_EVERY == 0:
+                        f.flush()
+                f.write(b"\n]\n")
             print(f"JSON saved: {output_path}")
 
+        elif fmt == "jsonl":
+            # One object per line → every flushed row is readable after a crash
+            with open(output_path, "wb", buffering=IO_BUFFER_SIZE) as f:
+                for i, result in enumerate(results, 1):
+                    f.write(orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE))
+                    if i % FLUSH_EVERY == 0:
+                        f.flush()
+            print(f"JSONL saved: {output_path}")
+
+        elif fmt == "parquet":
+            # Optional dependency → only needed for Parquet output
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                print("Parquet output requires pyarrow: pip install pyarrow")
+                return
+
+            schema = pa.schema([(field, pa.string()) for field in OUTPUT_FIELDNAMES])
+            with pq.ParquetWriter(output_path, schema, compression="zstd") as writer:
+                batch = []
+                for result in results:
+                    batch.append(result)
+                    if len(batch) >= PARQUET_BATCH_ROWS:
+                        writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                        batch = []
+                if batch:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            print(f"Parquet saved: {output_path}")
+
         else:
-            print("Unsupported format. Use csv or json.")
+            print("Unsupported format. Use csv, json, jsonl or parquet.")
 
 
 # ==================================================
@@ -262,9 +708,15 @@ if __name__ == "__main__":
         print("Set APOLLO_API_KEY environment variable.")
         exit(1)
 
-    client = ApolloClient(API_KEY)
-
     INPUT_CSV = "input.csv"
     OUTPUT_CSV = "apollo_output.csv"
 
-    client.process_csv(INPUT_CSV, OUTPUT_CSV, output_format="csv")
+    # Opt-in crash resume, e.g. APOLLO_CHECKPOINT_DB=apollo_checkpoint.db
+    CHECKPOINT_DB = os.getenv("APOLLO_CHECKPOINT_DB")
+
+    client = ApolloClient(API_KEY, checkpoint_path=CHECKPOINT_DB)
+
+    try:
+        client.process_csv(INPUT_CSV, OUTPUT_CSV, output_format="csv")
+    finally:
+        client.close()